@@ -1,6 +1,21 @@
 import simpy
-import random
 import math
+import argparse
+import os
+import statistics
+import sys
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from itertools import count
+from heapq import heappop, heappush, heapreplace
+from multiprocessing import Pool
+
+import numpy as np
+
+from simcommon import (MonitoredResource, RNGPool, TwoPriorityResource, draw_jobs,
+                       time_weighted_area)
 
 # --- Global Parameters ---
 
@@ -8,6 +23,12 @@ MAC_CAPACITY = 6
 CAM_CAPACITY = 12
 SIMULATION_TIME = 1440
 BATCH_SIZE = 200 
+MAX_JOBS = 10000
+
+# With COLLECT_STATS off the same model runs without any bookkeeping (the
+# old stats-less pythonversion.py): jobs flow through MAC, ASSEMBLE and CAM
+# with the same draws, but nothing is recorded and no report is printed
+COLLECT_STATS = True
 
 # ADVANCE time parameters
 ADVANCE_SERVICE_MEAN = 0.75
@@ -16,13 +37,41 @@ ADVANCE_SERVICE_ERR_DEV = 2
 ADVANCE_CAM_MEAN = 372.5
 ADVANCE_CAM_DEV = 2.5
 
-# --- Helper Functions for Distributions ---
+# --- Helper Functions for Statistics ---
+
+class TimeIntegral:
+    # Running integral of a step function instead of its (time, value)
+    # history: every change adds the area of the step that just ended, so
+    # the time-weighted average is O(1) and nothing grows with the run
+    __slots__ = ('area', 'last_time', 'last')
+
+    def __init__(self):
+        self.area = 0.0
+        self.last_time = 0.0
+        self.last = 0
+
+    def record(self, now, value):
+        if value != self.last:
+            self.area += self.last * (now - self.last_time)
+            self.last_time = now
+            self.last = value
+
+    def average(self, now):
+        if now <= 0:
+            return 0
+        return (self.area + self.last * (now - self.last_time)) / now
 
-def xpon_dist(mean):
-    return random.expovariate(1.0 / mean)
+# --- Random Variate Pool (pre-generated NumPy batches) ---
 
-def normal_dist(mean, stdev):
-    return max(0, random.gauss(mean, stdev))
+def new_pool(seed):
+    return RNGPool(seed, ADVANCE_SERVICE_MEAN, ADVANCE_CAM_MEAN, ADVANCE_CAM_DEV)
+
+pool = new_pool(42)
+
+def new_jobs():
+    # Every per-job decision of a replication, drawn from pool.rng before
+    # any service time
+    return draw_jobs(pool.rng, MAX_JOBS, ADVANCE_SERVICE_ERR_MEAN, ADVANCE_SERVICE_ERR_DEV)
 
 # --- Batch Assembler Class (Uses the corrected batch counting) ---
 
@@ -32,13 +81,11 @@ class BatchAssembler:
         self.name = name
         self.batch_size = batch_size
         self.stats = stats # Store stats object
-        self.waiting_jobs = []
         self.batch_count = 0
         self.release_event = self.env.event() 
 
     def assemble(self, job_id):
         self.batch_count += 1
-        self.waiting_jobs.append(job_id)
         
         if self.batch_count >= self.batch_size:
             release = self.release_event
@@ -54,57 +101,87 @@ class BatchAssembler:
             
         return self.release_event
 
+# --- CAM Wait List Class (records its own length in blocks) ---
+
+class CamWaitList:
+    # Manual ARRIVE queo/quet list. Only its length is ever read, so it is
+    # kept as a plain job count. Jobs come and go one at a time, so the
+    # length in blocks of BATCH_SIZE only changes when the count crosses a
+    # block boundary: the series is only touched then and left alone for the
+    # other 199 of every 200 jobs. The caller passes the time it already holds instead of
+    # env.now
+    def __init__(self):
+        self.count = 0
+        self.queue_length = TimeIntegral()
+
+    def __len__(self):
+        return self.count
+
+    def arrive(self, now):
+        self.count = n = self.count + 1
+        # The job opening a new block (every job when BATCH_SIZE is 1)
+        if (n - 1) % BATCH_SIZE == 0:
+            self.queue_length.record(now, -(-n // BATCH_SIZE))
+
+    def depart(self, now):
+        self.count = n = self.count - 1
+        if n % BATCH_SIZE == 0:
+            self.queue_length.record(now, n // BATCH_SIZE)
+
+# --- Replication Result (plain, picklable summary of one run) ---
+
+@dataclass
+class ReplicationResult:
+    seed: int
+    jobs_generated: int
+    jobs_terminated: int
+    assembled_batches: int
+    priority_1_count: int
+    avg_mac_queue: float
+    avg_queo_queue: float
+    avg_quet_queue: float
+    avg_mac_wait: float = None
+    avg_system_time: float = None
+
 # --- Statistics Collector Class ---
 
 class StatisticsCollector:
-    def __init__(self, env):
+    def __init__(self, env, jobs, collect=True):
         self.env = env
+        self.collect = collect
         self.jobs_generated = 0
         self.jobs_terminated = 0
         self.priority_1_count = 0
         self.assembled_batches = 0
         
-        self.queo_wait_list = [] 
-        self.quet_wait_list = [] 
+        # GOTO noerr,0.99, read by job_process
+        self.error_jobs = jobs.error_jobs
+        self.error_delays = jobs.error_delays
         
-        self.mac_wait_times = []
-        self.cam_wait_times = []
-        self.system_times = [] 
+        self.queo_wait_list = CamWaitList()
+        self.quet_wait_list = CamWaitList()
         
-        self.queue_mac_length = [(0, 0)]
-        self.queue_queo_length = [(0, 0)] 
-        self.queue_quet_length = [(0, 0)] 
+        # Raw doubles instead of lists of boxed floats
+        self.mac_wait_times = array('d')
+        self.cam_wait_times = array('d')
+        self.system_times = array('d') 
 
 
-    def record_queue_length(self, queue_list, waiting_jobs_list, is_cam_queue=False):
-        
-        length = len(waiting_jobs_list)
-        
-        if is_cam_queue and length > 0:
-            length = math.ceil(length / BATCH_SIZE)
-        
-        if not queue_list or queue_list[-1][1] != length:
-             queue_list.append((self.env.now, length))
-             
-    def calculate_time_weighted_average(self, data_list):
-        if len(data_list) <= 1:
-            return 0
-            
-        total_area = 0
-        total_time = self.env.now
-        
-        for i in range(len(data_list) - 1):
-            time_start, value = data_list[i]
-            time_end = data_list[i+1][0]
-            total_area += value * (time_end - time_start)
-            
-        last_value = data_list[-1][1]
-        last_time = data_list[-1][0]
-        total_area += last_value * (total_time - last_time)
-
-        return total_area / total_time if total_time > 0 else 0
+    def summary(self, seed=None):
+        return ReplicationResult(
+            seed=seed,
+            jobs_generated=self.jobs_generated,
+            jobs_terminated=self.jobs_terminated,
+            assembled_batches=self.assembled_batches,
+            priority_1_count=self.priority_1_count,
+            avg_mac_queue=self.mac.queue_length.average(self.env.now),
+            avg_queo_queue=self.queo_wait_list.queue_length.average(self.env.now),
+            avg_quet_queue=self.quet_wait_list.queue_length.average(self.env.now),
+            avg_mac_wait=math.fsum(self.mac_wait_times) / len(self.mac_wait_times) if self.mac_wait_times else None,
+            avg_system_time=math.fsum(self.system_times) / len(self.system_times) if self.system_times else None,
+        )
 
-    def report(self):
+    def report(self, result):
         print("\n" + "="*50)
         print(" SIMULATION STATISTICS REPORT ".center(50, ' '))
         print("="*50)
@@ -147,22 +224,14 @@ class StatisticsCollector:
         
         print("\n--- Time-Weighted Averages and Wait Times ---")
         
-        self.record_queue_length(self.queue_mac_length, self.mac.queue)
-        self.record_queue_length(self.queue_queo_length, self.queo_wait_list, is_cam_queue=True)
-        self.record_queue_length(self.queue_quet_length, self.quet_wait_list, is_cam_queue=True)
-        
-        avg_mac_queue = self.calculate_time_weighted_average(self.queue_mac_length)
-        avg_queo_queue = self.calculate_time_weighted_average(self.queue_queo_length)
-        avg_quet_queue = self.calculate_time_weighted_average(self.queue_quet_length)
-        
-        print(f"5. Average MAC Queue Size (Jobs): {avg_mac_queue:.3f}")
-        print(f"6. Average CAM QUEO Queue Size (Blocks): {avg_queo_queue:.3f}")
-        print(f"7. Average CAM QUET Queue Size (Blocks): {avg_quet_queue:.3f}")
-
-        if self.mac_wait_times:
-            print(f"8. Average MAC Wait Time: {sum(self.mac_wait_times) / len(self.mac_wait_times):.3f}")
-        if self.system_times:
-            print(f"9. Average Total Time in System: {sum(self.system_times) / len(self.system_times):.3f}")
+        print(f"5. Average MAC Queue Size (Jobs): {result.avg_mac_queue:.3f}")
+        print(f"6. Average CAM QUEO Queue Size (Blocks): {result.avg_queo_queue:.3f}")
+        print(f"7. Average CAM QUET Queue Size (Blocks): {result.avg_quet_queue:.3f}")
+
+        if result.avg_mac_wait is not None:
+            print(f"8. Average MAC Wait Time: {result.avg_mac_wait:.3f}")
+        if result.avg_system_time is not None:
+            print(f"9. Average Total Time in System: {result.avg_system_time:.3f}")
             
         print("\n--- Custom Logic Statistics ---")
         print(f"10. Total Instances assigned Priority 1: {self.priority_1_count}")
@@ -171,109 +240,122 @@ class StatisticsCollector:
 
 # --- The AGPSS Transaction/Job Logic ---
 
-def job_process(env, mac, cam, stats, job_id, priority, queo_assembler, quet_assembler):
+def job_process(env, mac, cam, stats, pool, job_id, priority, assembler, wait_list):
     
+    # env.now is read once per resumption into a local; the MAC wait starts
+    # at the arrival itself
+    collect = stats.collect
     arrival_time = env.now
     
-    # 1. MAC Facility Section
-    stats.record_queue_length(stats.queue_mac_length, mac.queue)
-    mac_wait_start = env.now
-
-    with mac.request(priority=priority) as req:
-        yield req
+    # 1. MAC Facility Section. The resources are requested and released
+    # explicitly rather than through the Request context manager
+    req = mac.request(priority=priority)
+    yield req
+    try:
+        if collect:
+            stats.mac_wait_times.append(env.now - arrival_time)
         
-        stats.mac_wait_times.append(env.now - mac_wait_start)
-        stats.record_queue_length(stats.queue_mac_length, mac.queue)
+        yield env.timeout(pool.next_expon())
         
-        yield env.timeout(xpon_dist(ADVANCE_SERVICE_MEAN))
-        
-        if random.random() >= 0.99:
-            yield env.timeout(normal_dist(ADVANCE_SERVICE_ERR_MEAN, ADVANCE_SERVICE_ERR_DEV))
+        if job_id in stats.error_jobs:
+            yield env.timeout(next(stats.error_delays))
+    finally:
+        mac.release(req)
             
-    # 2. CAM Facility Section
+    # 2. CAM Facility Section: the branch (quet for ZNT, queo by default)
+    # is picked by job_generator as its (assembler, wait_list) pair
     cam_wait_start = env.now
     
-    if random.random() < 0.5:
-        # --- ZNT Branch (quet) ---
-        
-        yield quet_assembler.assemble(job_id)
-        
-        # ARRIVE quet
-        stats.quet_wait_list.append(job_id)
-        stats.record_queue_length(stats.queue_quet_length, stats.quet_wait_list, is_cam_queue=True)
-        
-        with cam.request(priority=0) as req_cam:
-            yield req_cam
-            
-            # Job is processed, remove from manual list 
-            stats.quet_wait_list.remove(job_id)
-            stats.cam_wait_times.append(env.now - cam_wait_start)
-            stats.record_queue_length(stats.queue_quet_length, stats.quet_wait_list, is_cam_queue=True)
-            
-            yield env.timeout(normal_dist(ADVANCE_CAM_MEAN, ADVANCE_CAM_DEV))
-            
-    else:
-        # --- Default Branch (queo) ---
-        
-        yield queo_assembler.assemble(job_id)
-
-        # ARRIVE queo
-        stats.queo_wait_list.append(job_id)
-        print(len(stats.queo_wait_list))
-        stats.record_queue_length(stats.queue_queo_length, stats.queo_wait_list, is_cam_queue=True)
+    yield assembler.assemble(job_id)
+    
+    # ARRIVE queo/quet
+    if collect:
+        now = env.now
+        wait_list.arrive(now)
+    
+    req_cam = cam.request(priority=0)
+    yield req_cam
+    try:
+        # Job is processed, remove from manual list
+        if collect:
+            now = env.now
+            wait_list.depart(now)
+            stats.cam_wait_times.append(now - cam_wait_start)
         
-        with cam.request(priority=0) as req_cam:
-            yield req_cam
-            
-            # Job is processed, remove from manual list
-            stats.queo_wait_list.remove(job_id)
-            stats.cam_wait_times.append(env.now - cam_wait_start)
-            stats.record_queue_length(stats.queue_queo_length, stats.queo_wait_list, is_cam_queue=True)
-            
-            yield env.timeout(normal_dist(ADVANCE_CAM_MEAN, ADVANCE_CAM_DEV))
+        yield env.timeout(pool.next_cam())
+    finally:
+        cam.release(req_cam)
             
     # TERMINATE
-    finish_time = env.now
-    stats.jobs_terminated += 1
-    stats.system_times.append(finish_time - arrival_time)
+    if collect:
+        now = env.now
+        stats.jobs_terminated += 1
+        stats.system_times.append(now - arrival_time)
+
+# The same generator with typed locals, compiled by Cython, replaces the
+# pure-Python one when the extension is built (cythonize -i job_process.pyx).
+# Not under PyPy: its JIT runs the plain generator faster than it can call
+# into a cpyext extension module
+if sys.implementation.name != 'pypy':
+    try:
+        from job_process import job_process
+    except ImportError:
+        pass
 
 
 # --- The GENERATE/Source Functions (CORRECTED Priority Logic) ---
 
-def job_generator(env, mac, cam, stats, queo_assembler, quet_assembler):
+def job_generator(env, mac, cam, stats, jobs, queo_assembler, quet_assembler):
     """Generates jobs."""
     job_id = 0
-    max_jobs = 10000
+    collect = stats.collect
+    
+    # Every arrival time and per-job decision was drawn up front (draw_jobs)
+    arrival_times = jobs.arrival_times[1:]
+    priorities = jobs.priorities[1:]
+    branches = jobs.branches[1:]
     
-    while job_id < max_jobs:
+    # Indexed by the branch draw: False -> queo, True -> quet (ZNT)
+    branch_table = ((queo_assembler, stats.queo_wait_list),
+                    (quet_assembler, stats.quet_wait_list))
+    
+    for arrival_time, priority, branch in zip(arrival_times, priorities, branches):
         job_id += 1
-        stats.jobs_generated += 1
+        if collect:
+            stats.jobs_generated += 1
         
-        time_to_next = random.uniform(0.15 - 0.05, 0.15 + 0.05)
-        yield env.timeout(time_to_next)
+        yield env.timeout(arrival_time - env.now)
         
-        # CORRECTED: GOTO arr, 0.9 means 10% chance (1-0.9) for LET PRIORITY=1
-        if random.random() <= 0.1:
-            priority = 1
-            stats.priority_1_count += 1
-        else:
-            priority = 0
+        if collect:
+            stats.priority_1_count += priority
 
-        env.process(job_process(env, mac, cam, stats, job_id, priority, 
-                                queo_assembler, quet_assembler))
+        assembler, wait_list = branch_table[branch]
+        env.process(job_process(env, mac, cam, stats, pool, job_id, priority, assembler, wait_list))
 
 
-def run_simulation(until_time):
-    """Sets up the environment and runs the simulation."""
+def run_simulation(until_time, seed=None, verbose=True):
+    """Sets up the environment, runs one replication and returns its ReplicationResult.
     
-    print("--- Starting SimPy AGPSS Conversion with Corrected Priority ---")
+    With COLLECT_STATS off nothing is monitored and None is returned.
+    """
+    
+    global pool
+    if seed is not None:
+        pool = new_pool(seed)
+    
+    if verbose:
+        print("--- Starting SimPy AGPSS Conversion with Corrected Priority ---")
     
     env = simpy.Environment()
     
-    mac = simpy.PriorityResource(env, capacity=MAC_CAPACITY)
-    cam = simpy.PriorityResource(env, capacity=CAM_CAPACITY)
+    if COLLECT_STATS:
+        mac = MonitoredResource(env, MAC_CAPACITY, TimeIntegral)
+    else:
+        mac = TwoPriorityResource(env, capacity=MAC_CAPACITY)
+    cam = TwoPriorityResource(env, capacity=CAM_CAPACITY)
     
-    stats = StatisticsCollector(env)
+    jobs = new_jobs()
+    stats = StatisticsCollector(env, jobs, collect=COLLECT_STATS)
     
     queo_assembler = BatchAssembler(env, 'queo', BATCH_SIZE, stats)
     quet_assembler = BatchAssembler(env, 'quet', BATCH_SIZE, stats)
@@ -283,15 +365,388 @@ def run_simulation(until_time):
     stats.queo_assembler = queo_assembler
     stats.quet_assembler = quet_assembler
     
-    env.process(job_generator(env, mac, cam, stats, queo_assembler, quet_assembler))
+    env.process(job_generator(env, mac, cam, stats, jobs, queo_assembler, quet_assembler))
     
     env.run(until=until_time)
     
-    print(f"--- Simulation Run Complete at Time {env.now:.2f} ---")
+    result = stats.summary(seed) if COLLECT_STATS else None
     
-    stats.report()
+    if verbose:
+        print(f"--- Simulation Run Complete at Time {env.now:.2f} ---")
+        if result is not None:
+            stats.report(result)
+    
+    return result
+
+
+# --- Specialized heapq Event Loop (no SimPy) ---
+
+ARRIVAL, MAC_DONE, ERROR_DONE, CAM_DONE = range(4)
+
+def run_heap(until_time, seed=None):
+    """Runs one replication on a bespoke heapq event loop and returns its ReplicationResult.
+    
+    The topology is fixed (MAC -> ASSEMBLE -> CAM), so events are plain
+    (time, seq, kind, job_id) tuples on one heap, the facilities are busy
+    counters with FIFO deques and each ASSEMBLE is a counter plus the list
+    of jobs waiting for the batch. The draws are made in the same order as
+    run_simulation, from the same RNGPool streams.
+    """
+    global pool
+    if seed is not None:
+        pool = new_pool(seed)
+    next_expon = pool.next_expon
+    next_cam = pool.next_cam
+    max_jobs = MAX_JOBS
+    
+    # The same up-front draws as run_simulation
+    jobs = new_jobs()
+    error_jobs = jobs.error_jobs
+    error_delays = jobs.error_delays
+    arrival_times = jobs.arrival_times
+    priorities = jobs.priorities
+    branches = jobs.branches
+    
+    seq = count() # FIFO among simultaneous events, like SimPy's event ids
+    events = [(arrival_times[1], next(seq), ARRIVAL, 1)]
+    
+    mac_busy = 0
+    mac_waiting = (deque(), deque()) # lower priority value served first
+    mac_queue_length = TimeIntegral()
+    cam_busy = 0
+    cam_waiting = deque()
+    
+    # Per branch (queo = 0, quet = 1): ASSEMBLE count, jobs waiting for the
+    # batch, jobs waiting for the CAM and the CAM queue series in blocks
+    assemble_count = [0, 0]
+    assemble_waiting = [[], []]
+    cam_branch_waiting = [0, 0]
+    cam_branch_length = [TimeIntegral(), TimeIntegral()]
+    
+    arrived = 0
+    assembled_batches = 0
+    priority_1_count = 0
+    jobs_terminated = 0
+    mac_wait_times = array('d')
+    system_times = array('d')
+    
+    def start_mac(job_id, now):
+        nonlocal mac_busy
+        mac_busy += 1
+        mac_wait_times.append(now - arrival_times[job_id])
+        heappush(events, (now + next_expon(), next(seq), MAC_DONE, job_id))
+    
+    def start_cam(job_id, now):
+        nonlocal cam_busy
+        cam_busy += 1
+        branch = branches[job_id]
+        cam_branch_waiting[branch] -= 1
+        cam_branch_length[branch].record(now, -(-cam_branch_waiting[branch] // BATCH_SIZE))
+        heappush(events, (now + next_cam(), next(seq), CAM_DONE, job_id))
+    
+    def leave_mac(job_id, now):
+        nonlocal mac_busy, assembled_batches
+        mac_busy -= 1
+        waiting = mac_waiting[0] or mac_waiting[1]
+        if waiting:
+            start_mac(waiting.popleft(), now)
+            mac_queue_length.record(now, len(mac_waiting[0]) + len(mac_waiting[1]))
+        
+        # ASSEMBLE 200: the job completing a batch releases the jobs waiting
+        # for it and itself waits for the next batch, like BatchAssembler
+        branch = branches[job_id]
+        assemble_count[branch] += 1
+        if assemble_count[branch] < BATCH_SIZE:
+            assemble_waiting[branch].append(job_id)
+            return
+        assembled_batches += 1
+        assemble_count[branch] = 0
+        released, assemble_waiting[branch] = assemble_waiting[branch], [job_id]
+        
+        # ARRIVE queo/quet, then request the CAM
+        cam_branch_waiting[branch] += len(released)
+        cam_branch_length[branch].record(now, -(-cam_branch_waiting[branch] // BATCH_SIZE))
+        for released_id in released:
+            if cam_busy < CAM_CAPACITY:
+                start_cam(released_id, now)
+            else:
+                cam_waiting.append(released_id)
+    
+    while events:
+        now, _, kind, job_id = heappop(events)
+        # Like env.run(until=...), events at until_time are not processed
+        if now >= until_time:
+            break
+        
+        if kind == ARRIVAL:
+            arrived += 1
+            priority = priorities[job_id]
+            priority_1_count += priority
+            if job_id < max_jobs:
+                heappush(events, (arrival_times[job_id + 1], next(seq), ARRIVAL, job_id + 1))
+            
+            if mac_busy < MAC_CAPACITY:
+                start_mac(job_id, now)
+            else:
+                mac_waiting[priority].append(job_id)
+                mac_queue_length.record(now, len(mac_waiting[0]) + len(mac_waiting[1]))
+        
+        elif kind == MAC_DONE:
+            if job_id in error_jobs:
+                heappush(events, (now + next(error_delays), next(seq), ERROR_DONE, job_id))
+            else:
+                leave_mac(job_id, now)
+        
+        elif kind == ERROR_DONE:
+            leave_mac(job_id, now)
+        
+        else: # CAM_DONE, TERMINATE
+            cam_busy -= 1
+            jobs_terminated += 1
+            system_times.append(now - arrival_times[job_id])
+            if cam_waiting:
+                start_cam(cam_waiting.popleft(), now)
+    
+    return ReplicationResult(
+        seed=seed,
+        # job_generator counts a job before waiting for its arrival
+        jobs_generated=min(arrived + 1, max_jobs),
+        jobs_terminated=jobs_terminated,
+        assembled_batches=assembled_batches,
+        priority_1_count=priority_1_count,
+        avg_mac_queue=mac_queue_length.average(until_time),
+        avg_queo_queue=cam_branch_length[0].average(until_time),
+        avg_quet_queue=cam_branch_length[1].average(until_time),
+        avg_mac_wait=math.fsum(mac_wait_times) / len(mac_wait_times) if mac_wait_times else None,
+        avg_system_time=math.fsum(system_times) / len(system_times) if system_times else None,
+    )
+
+# --- Queue Departure Computation (QDC, no event loop) ---
+
+def qdc_priority_starts(arrivals, priorities, service, capacity):
+    # Service start of every job at a non-preemptive c-server priority queue;
+    # like simpy.PriorityResource, the lower priority value is served first
+    # and jobs of equal priority are served FIFO
+    arr = arrivals.tolist()
+    prio = priorities.tolist()
+    srv = service.tolist()
+    n = len(arr)
+    
+    start = np.empty(n)
+    free = [0.0] * capacity # heap of the times the servers become free
+    waiting = (deque(), deque()) # one FIFO per priority value
+    i = 0
+    
+    for _ in range(n):
+        t = free[0]
+        # Every job that has arrived by the time a server frees up is waiting
+        while i < n and arr[i] <= t:
+            waiting[prio[i]].append(i)
+            i += 1
+        
+        if waiting[0]:
+            j = waiting[0].popleft()
+        elif waiting[1]:
+            j = waiting[1].popleft()
+        else:
+            # Nobody waiting: the server idles until the next arrival
+            j = i
+            i += 1
+        
+        s = max(t, arr[j])
+        start[j] = s
+        heapreplace(free, s + srv[j])
+    
+    return start
+
+
+def qdc_fifo_starts(requests, service, capacity):
+    # Service start of every job at a FIFO c-server queue, with the request
+    # times sorted; infinite requests (jobs that never get there) stay inf
+    start = np.full(len(requests), np.inf)
+    free = [0.0] * capacity
+    
+    for j, (r, srv) in enumerate(zip(requests.tolist(), service.tolist())):
+        if r == np.inf:
+            break
+        s = max(free[0], r)
+        start[j] = s
+        heapreplace(free, s + srv)
+    
+    return start
+
+
+def qdc_queue_average(enter, leave, until_time, block_size=1):
+    # Time-weighted average number of jobs between enter and leave (in
+    # blocks of block_size when given), from the sorted +1/-1 transitions
+    enter = enter[enter <= until_time]
+    leave = leave[leave <= until_time]
+    times = np.concatenate(([0.0], enter, leave))
+    steps = np.concatenate(([0], np.ones(len(enter), np.int64), -np.ones(len(leave), np.int64)))
+    
+    # Stable sort, so at equal times a job enters before it leaves
+    order = np.argsort(times, kind='stable')
+    times = times[order]
+    values = np.cumsum(steps[order])
+    if block_size > 1:
+        values = -(-values // block_size)
+    
+    return time_weighted_area(times, values.astype(np.float64), until_time) / until_time
+
+
+def run_qdc(until_time, seed=None, max_jobs=MAX_JOBS):
+    """Solves one replication with QDC and returns its ReplicationResult.
+    
+    The model is a fixed MAC -> ASSEMBLE -> CAM pipeline with service times
+    that do not depend on the state, so the start and departure of every job
+    can be computed stage by stage from the pre-drawn times, without SimPy.
+    It draws its own NumPy streams, so it agrees with run_simulation in
+    distribution, not run by run.
+    """
+    rng = np.random.default_rng(seed)
+    n = max_jobs
+    
+    # GENERATE and every per-job draw, up front
+    arrivals = np.cumsum(rng.uniform(0.15 - 0.05, 0.15 + 0.05, n))
+    priorities = (rng.random(n) <= 0.1).astype(np.int8)
+    service = rng.exponential(ADVANCE_SERVICE_MEAN, n)
+    errors = rng.random(n) >= 0.99
+    service[errors] += np.maximum(0, rng.normal(ADVANCE_SERVICE_ERR_MEAN, ADVANCE_SERVICE_ERR_DEV, errors.sum()))
+    quet = rng.random(n) < 0.5
+    cam_service = np.maximum(0, rng.normal(ADVANCE_CAM_MEAN, ADVANCE_CAM_DEV, n))
+    
+    # 1. MAC Facility
+    mac_start = qdc_priority_starts(arrivals, priorities, service, MAC_CAPACITY)
+    mac_departure = mac_start + service
+    
+    # 2. ASSEMBLE: a branch's batch is released when its BATCH_SIZE-th job
+    # leaves the MAC. Like BatchAssembler, that job is not released with it
+    # but waits for the next batch, so every batch releases the job that
+    # completed the previous one and the BATCH_SIZE - 1 jobs after it; the
+    # jobs of an incomplete batch never reach the CAM
+    release = np.full(n, np.inf)
+    batch_releases = []
+    for branch in (~quet, quet):
+        jobs = np.flatnonzero(branch)
+        jobs = jobs[np.argsort(mac_departure[jobs], kind='stable')]
+        full = len(jobs) // BATCH_SIZE * BATCH_SIZE
+        batch_times = mac_departure[jobs[BATCH_SIZE - 1:full:BATCH_SIZE]]
+        if full:
+            release[jobs[:full - 1]] = np.repeat(batch_times, BATCH_SIZE)[1:]
+        batch_releases.append(batch_times)
+    
+    # 3. CAM Facility: FIFO in release order, a batch in MAC departure order
+    order = np.lexsort((mac_departure, release))
+    cam_start = np.empty(n)
+    cam_start[order] = qdc_fifo_starts(release[order], cam_service[order], CAM_CAPACITY)
+    finish = cam_start + cam_service
+    
+    # Statistics up to until_time, as the SimPy run would record them
+    generated = np.searchsorted(arrivals, until_time, side='right')
+    mac_served = mac_start <= until_time
+    terminated = finish <= until_time
+    
+    return ReplicationResult(
+        seed=seed,
+        jobs_generated=min(int(generated) + 1, n),
+        jobs_terminated=int(terminated.sum()),
+        assembled_batches=sum(int((b <= until_time).sum()) for b in batch_releases),
+        priority_1_count=int(priorities[:generated].sum()),
+        avg_mac_queue=qdc_queue_average(arrivals, mac_start, until_time),
+        avg_queo_queue=qdc_queue_average(release[~quet], cam_start[~quet], until_time, BATCH_SIZE),
+        avg_quet_queue=qdc_queue_average(release[quet], cam_start[quet], until_time, BATCH_SIZE),
+        avg_mac_wait=float((mac_start - arrivals)[mac_served].mean()) if mac_served.any() else None,
+        avg_system_time=float((finish - arrivals)[terminated].mean()) if terminated.any() else None,
+    )
+
+
+def run_replications(run, seeds):
+    """Runs run(seed) once per seed, spread over all cores."""
+    
+    # Each replication is CPU-bound pure Python with no shared state, so
+    # processes (not threads, because of the GIL) give a near-linear speedup
+    with Pool(min(os.cpu_count() or 1, len(seeds))) as p:
+        return p.map(run, seeds)
+
+
+# Two-sided 95% Student t quantiles t(0.975, df) for df = 1..29, that is
+# up to 30 replications; past that the normal quantile is close enough
+T_975 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+         2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+         2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045)
+
+def t_quantile_975(n):
+    # Multiplier of the standard error for a 95% interval from n samples
+    if n - 1 <= len(T_975):
+        return T_975[n - 2]
+    return statistics.NormalDist().inv_cdf(0.975)
+
+
+def report_replications(results):
+    n = len(results)
+    
+    print("\n" + "="*50)
+    print(f" {n} REPLICATIONS SUMMARY ".center(50, ' '))
+    print("="*50)
+    print("Mean, standard deviation and 95% confidence interval half-width")
+    print("-" * 50)
+    
+    metrics = [
+        ("Jobs Terminated", "jobs_terminated"),
+        ("Batches Assembled", "assembled_batches"),
+        ("Average MAC Queue Size (Jobs)", "avg_mac_queue"),
+        ("Average CAM QUEO Queue Size (Blocks)", "avg_queo_queue"),
+        ("Average CAM QUET Queue Size (Blocks)", "avg_quet_queue"),
+        ("Average MAC Wait Time", "avg_mac_wait"),
+        ("Average Total Time in System", "avg_system_time"),
+    ]
+    
+    for label, name in metrics:
+        values = [getattr(r, name) for r in results if getattr(r, name) is not None]
+        if not values:
+            continue
+        mean = statistics.mean(values)
+        if len(values) < 2:
+            # One sample has no spread to estimate an interval from
+            print(f"{label}: {mean:.3f} (sd n/a, +/- n/a)")
+            continue
+        stdev = statistics.stdev(values)
+        half_width = t_quantile_975(len(values)) * stdev / math.sqrt(len(values))
+        print(f"{label}: {mean:.3f} (sd {stdev:.3f}, +/- {half_width:.3f})")
+    print("="*50)
 
 # --- Execution ---
 if __name__ == '__main__':
-    random.seed(42) 
-    run_simulation(SIMULATION_TIME)
+    parser = argparse.ArgumentParser(description="SimPy conversion of the PROGFINAL_1 GPSS model with ASSEMBLE")
+    parser.add_argument('--replications', type=int, default=1,
+                        help="number of independent replications to run in parallel (default: 1)")
+    parser.add_argument('--seed', type=int, default=42,
+                        help="base seed, replication i (from 0) uses seed + i (default: 42)")
+    parser.add_argument('--engine', choices=['simpy', 'heap', 'qdc'], default='simpy',
+                        help="SimPy model (default), specialized heapq event loop or vectorized QDC pipeline")
+    parser.add_argument('--no-stats', action='store_true',
+                        help="run the SimPy model without collecting or reporting statistics")
+    args = parser.parse_args()
+    
+    if args.replications < 1:
+        parser.error("--replications must be at least 1")
+    if args.seed < 0:
+        parser.error("--seed must not be negative")
+    if args.no_stats:
+        if args.engine != 'simpy' or args.replications > 1:
+            parser.error("--no-stats only applies to a single SimPy run")
+        COLLECT_STATS = False
+    
+    impl = sys.implementation
+    print(f"Running on {impl.name} {impl.version.major}.{impl.version.minor}.{impl.version.micro}")
+    
+    seeds = [args.seed + i for i in range(args.replications)]
+    if args.engine == 'qdc':
+        # A QDC replication takes milliseconds, so there is nothing to parallelize
+        report_replications([run_qdc(SIMULATION_TIME, seed) for seed in seeds])
+    elif args.engine == 'heap':
+        report_replications(run_replications(partial(run_heap, SIMULATION_TIME), seeds))
+    elif args.replications <= 1:
+        run_simulation(SIMULATION_TIME, seed=args.seed)
+    else:
+        report_replications(run_replications(partial(run_simulation, SIMULATION_TIME, verbose=False), seeds))
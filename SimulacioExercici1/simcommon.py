@@ -0,0 +1,133 @@
+import simpy
+from collections import deque
+from dataclasses import dataclass
+from itertools import chain
+
+import numpy as np
+
+# Building blocks shared by simulation.py and PySimWStatisticsUsingAssemble.py
+
+# --- Helper Functions for Statistics ---
+
+# Area under a (times, values) step function up to `now`, as one
+# vectorized NumPy reduction
+def time_weighted_area(times, values, now):
+    return np.dot(values[:-1], np.diff(times)) + values[-1] * (now - times[-1])
+
+# --- Random Variate Pool (pre-generated NumPy batches) ---
+
+POOL_SIZE = 65536
+
+class RNGPool:
+    def __init__(self, seed, service_mean, cam_mean, cam_dev, size=POOL_SIZE, cam_size=None):
+        self.rng = rng = np.random.default_rng(seed)
+        cam_size = size if cam_size is None else cam_size
+
+        # Each stream is an endless iterator over batches of draws, refilled
+        # on exhaustion; tolist() keeps the draws as plain floats
+        def stream(draw):
+            return chain.from_iterable(iter(lambda: draw().tolist(), None)).__next__
+
+        self.next_expon = stream(lambda: rng.exponential(service_mean, size))
+        # Clipped at 0 like the old normal_dist
+        self.next_cam = stream(lambda: np.maximum(0, rng.normal(cam_mean, cam_dev, cam_size)))
+
+# --- Up-front Job Draws (the same for the SimPy and heapq engines) ---
+
+@dataclass(slots=True)
+class JobDraws:
+    # Every per-job decision of a run; the lists are indexed by job id, so
+    # entry 0 is a placeholder
+    error_jobs: set
+    error_delays: object # iterator over the delays, in error job order
+    arrival_times: list
+    priorities: list
+    branches: list
+
+def draw_jobs(rng, n, error_mean, error_dev):
+    # The draws are made in this order, so an engine that calls this before
+    # touching any RNGPool stream sees exactly the same run as the others
+
+    # GOTO noerr,0.99: the jobs taking the error path and their delays
+    # (clipped at 0)
+    error_rolls = rng.random(n)
+    error_jobs = set((np.flatnonzero(error_rolls >= 0.99) + 1).tolist())
+    error_delays = iter(np.maximum(0, rng.normal(error_mean, error_dev, len(error_jobs))).tolist())
+    # GENERATE
+    arrival_times = [0.0] + np.cumsum(rng.uniform(0.15 - 0.05, 0.15 + 0.05, n)).tolist()
+    # CORRECTED: GOTO arr, 0.9 means 10% chance (1-0.9) for LET PRIORITY=1
+    priorities = [0] + (rng.random(n) <= 0.1).astype(np.int8).tolist()
+    # GOTO znt,0.5: False -> queo, True -> quet (ZNT)
+    branches = [False] + (rng.random(n) < 0.5).tolist()
+    return JobDraws(error_jobs, error_delays, arrival_times, priorities, branches)
+
+# --- Two-Priority Resource Class (one FIFO deque per priority) ---
+
+class TwoPriorityQueue:
+    # Put queue for requests of priority 0 or 1 only; any other priority is
+    # rejected with ValueError. SortedQueue re-sorts the whole list on every
+    # append; here each priority is a FIFO deque and the queue reads as
+    # priority 0 followed by priority 1, the order the sort would give (same
+    # priority requests are made in time order)
+    def __init__(self):
+        self._p0 = deque()
+        self._p1 = deque()
+
+    def append(self, request):
+        priority = request.priority
+        if priority == 0:
+            self._p0.append(request)
+        elif priority == 1:
+            self._p1.append(request)
+        else:
+            raise ValueError(f'TwoPriorityQueue only takes priorities 0 and 1, not {priority!r}')
+
+    def remove(self, request):
+        (self._p1 if request.priority else self._p0).remove(request)
+
+    def __len__(self):
+        return len(self._p0) + len(self._p1)
+
+    def _locate(self, idx):
+        # The deque holding the idx-th request and its index in it; negative
+        # indexes count from the end like they do on a list
+        if idx < 0:
+            idx += len(self)
+            if idx < 0:
+                raise IndexError('TwoPriorityQueue index out of range')
+        p0 = self._p0
+        if idx < len(p0):
+            return p0, idx
+        return self._p1, idx - len(p0)
+
+    def __getitem__(self, idx):
+        queue, idx = self._locate(idx)
+        return queue[idx]
+
+    def pop(self, idx=-1):
+        # _trigger_put only ever pops the request it just granted, the head
+        queue, idx = self._locate(idx)
+        request = queue[idx]
+        del queue[idx]
+        return request
+
+class TwoPriorityResource(simpy.PriorityResource):
+    # Same API and service order as simpy.PriorityResource (the lower value
+    # is served first), limited to priorities 0 and 1: a request with any
+    # other priority raises ValueError
+    PutQueue = TwoPriorityQueue
+
+# --- Monitored Resource Class (records its own queue length) ---
+
+class MonitoredResource(TwoPriorityResource):
+    # `series` is the step series class for the queue length; it only needs
+    # record(now, value)
+    def __init__(self, env, capacity, series):
+        super().__init__(env, capacity=capacity)
+        self.queue_length = series()
+
+    def _trigger_put(self, get_event):
+        # Both a new request and a processed release end up here, so this is
+        # the only place where the length of the waiting queue can change
+        super()._trigger_put(get_event)
+        self.queue_length.record(self._env.now, len(self.queue))
@@ -0,0 +1,637 @@
+import simpy
+import argparse
+import math
+import os
+import re
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from itertools import count
+from types import SimpleNamespace
+
+import numpy as np
+
+from simcommon import (POOL_SIZE, MonitoredResource, RNGPool, TwoPriorityResource,
+                       draw_jobs, time_weighted_area)
+
+# --- Global Parameters ---
+
+MAC_CAPACITY = 6
+CAM_CAPACITY = 12
+SIMULATION_TIME = 1440
+BATCH_SIZE = 200 
+MAX_JOBS = 10000
+
+# ADVANCE time parameters
+ADVANCE_SERVICE_MEAN = 0.75
+ADVANCE_SERVICE_ERR_MEAN = 15
+ADVANCE_SERVICE_ERR_DEV = 2
+ADVANCE_CAM_MEAN = 372.5
+ADVANCE_CAM_DEV = 2.5
+
+# --- Helper Functions for Statistics ---
+
+class StepSeries:
+    # Step function kept as (times, values) array('d') pairs, starting at
+    # (0, 0): an append there is cheaper than a NumPy scalar store, also on
+    # PyPy, and np.frombuffer views them without a copy at report and plot
+    # time. The last value is cached so record does not read the buffer back
+    __slots__ = ('times', 'values', 'last')
+
+    def __init__(self):
+        self.times = array('d', [0])
+        self.values = array('d', [0])
+        self.last = 0
+
+    def __len__(self):
+        return len(self.times)
+
+    def record(self, now, value):
+        if value != self.last:
+            self.times.append(now)
+            self.values.append(value)
+            self.last = value
+
+    def columns(self):
+        return np.frombuffer(self.times), np.frombuffer(self.values)
+
+# --- Random Variate Pool (pre-generated NumPy batches) ---
+
+# Only one job per batch of BATCH_SIZE reaches the CAM, so a smaller CAM
+# refill is enough
+pool = RNGPool(42, ADVANCE_SERVICE_MEAN, ADVANCE_CAM_MEAN, ADVANCE_CAM_DEV,
+               cam_size=POOL_SIZE // BATCH_SIZE)
+
+def new_jobs():
+    # Every per-job decision of the run, drawn from pool.rng before any
+    # service time
+    return draw_jobs(pool.rng, MAX_JOBS, ADVANCE_SERVICE_ERR_MEAN, ADVANCE_SERVICE_ERR_DEV)
+
+# --- ASSEMBLE Counter (one per CAM branch) ---
+
+@dataclass(slots=True)
+class AssembleCounter:
+    # Jobs gathered so far towards the next batch of BATCH_SIZE
+    count: int = 0
+
+# --- Batch Assembler Class (Kept but not used in job_process) ---
+
+class BatchAssembler:
+    def __init__(self, env, name, batch_size, stats): 
+        self.env = env
+        self.name = name
+        self.batch_size = batch_size
+        self.stats = stats # Store stats object
+        self.batch_count = 0
+        self.release_event = self.env.event() 
+
+    def assemble(self, job_id):
+        self.batch_count += 1
+        
+        if self.batch_count >= self.batch_size:
+            release = self.release_event
+            
+            # CRITICAL FIX: Increment the assembled batch count here, once per batch
+            self.stats.assembled_batches += 1 
+            
+            # Reset for the next batch
+            self.batch_count = 0
+            self.release_event = self.env.event()
+            
+            release.succeed()
+            
+        return self.release_event
+
+# --- Utilization Resource Class (also records the units in use) ---
+
+class UtilizationResource(MonitoredResource):
+    def __init__(self, env, capacity):
+        super().__init__(env, capacity, StepSeries)
+        self.usage = StepSeries() # (time, count)
+
+    # The number of units in use only changes when a request is granted or
+    # a release is processed, so the usage series is exact, not sampled
+    def _do_put(self, event):
+        proceed = super()._do_put(event)
+        self._record_usage()
+        return proceed
+
+    def _do_get(self, event):
+        proceed = super()._do_get(event)
+        self._record_usage()
+        return proceed
+
+    def _record_usage(self):
+        self.usage.record(self._env.now, self.count)
+
+# --- Statistics Collector Class ---
+
+class StatisticsCollector:
+    def __init__(self, env, jobs):
+        self.env = env
+        self.jobs_generated = 0
+        self.jobs_terminated = 0
+        self.priority_1_count = 0
+        
+        # ASSEMBLE 200 counters for the 'lossy' CAM logic
+        self.queo_counter = AssembleCounter()
+        self.quet_counter = AssembleCounter()
+        
+        # GOTO noerr,0.99, read by job_process
+        self.error_jobs = jobs.error_jobs
+        self.error_delays = jobs.error_delays
+        
+        self.queo_wait_list = set()
+        self.quet_wait_list = set()
+        
+        # Raw doubles instead of lists of boxed floats
+        self.mac_wait_times = array('d')
+        self.queo_wait_times = array('d')
+        self.quet_wait_times = array('d')
+        self.cam_wait_times = array('d')
+        self.system_times = array('d') 
+        
+        self.queue_queo_length = StepSeries() 
+        self.queue_quet_length = StepSeries() 
+
+
+    def record_queue_length(self, now, queue_list, waiting_jobs_list, is_cam_queue=False):
+        # `now` is the caller's own env.now local, read once per resumption
+        
+        length = len(waiting_jobs_list)
+        
+        if is_cam_queue:
+            length = -(-length // BATCH_SIZE) # integer ceil division, 0 stays 0
+        
+        queue_list.record(now, length)
+             
+    def calculate_time_weighted_average(self, data_list):
+        if len(data_list) <= 1:
+            return 0
+
+        total_time = self.env.now
+        total_area = time_weighted_area(*data_list.columns(), total_time)
+
+        return total_area / total_time if total_time > 0 else 0
+
+    def generate_graphs(self, output_dir=None):
+        # Imported here so runs without graphs (and PyPy runs) skip loading matplotlib.
+        # With an output_dir the figures are only saved to PNG files, so the
+        # non-interactive Agg backend is selected before pyplot is loaded
+        import matplotlib
+        if output_dir is not None:
+            matplotlib.use('Agg')
+            os.makedirs(output_dir, exist_ok=True)
+        import matplotlib.pyplot as plt
+        
+        # Define the statistics to plot
+        plot_data = {
+            "MAC Facility Utilization (Units in Use)": (self.mac.usage, MAC_CAPACITY, "Units in Use"),
+            "CAM Facility Utilization (Units in Use)": (self.cam.usage, CAM_CAPACITY, "Units in Use"),
+            "MAC Queue Length (Jobs)": (self.mac.queue_length, None, "Jobs Waiting"),
+            "CAM QUEO Queue Length (Blocks)": (self.queue_queo_length, None, "Blocks Waiting"),
+            "CAM QUET Queue Length (Blocks)": (self.queue_quet_length, None, "Blocks Waiting"),
+        }
+        
+        for title, (data_list, capacity, ylabel) in plot_data.items():
+            
+            times, values = data_list.columns()
+
+            if len(times) < 2:
+                print(f"Skipping plot for {title}: Insufficient data.")
+                continue
+
+            plt.figure(figsize=(10, 5))
+            # Use 'post' step function for SimPy state changes
+            plt.step(times, values, where='post') 
+            
+            # Add capacity line for utilization plots
+            if "Utilization" in title:
+                plt.axhline(capacity, color='r', linestyle='--', label=f'Capacity ({capacity} Units)')
+                plt.legend()
+            
+            # Add average line for queue length plots
+            elif "Queue" in title:
+                avg = self.calculate_time_weighted_average(data_list)
+                plt.axhline(avg, color='g', linestyle='--', label=f'Avg: {avg:.3f}')
+                plt.legend()
+
+            plt.title(f"{title} over Time")
+            plt.xlabel("Simulation Time")
+            plt.ylabel(ylabel)
+            plt.grid(True, linestyle=':', alpha=0.6)
+
+            if output_dir is None:
+                plt.show()
+            else:
+                file_name = re.sub(r'\W+', '_', title.lower()).strip('_')
+                plt.savefig(os.path.join(output_dir, f"{file_name}.png"))
+                plt.close()
+
+    def report(self, utilization=False):
+        print("\n" + "="*50)
+        print(" SIMULATION STATISTICS REPORT ".center(50, ' '))
+        print("="*50)
+        print(f"Total Simulation Time: {self.env.now:.2f}")
+        print("-" * 50)
+
+        # 1. REMAINING ELEMENTS CALCULATION
+        mac_in_queue = len(self.mac.queue)
+        mac_in_service = self.mac.count
+        
+        queo_in_queue_jobs = len(self.queo_wait_list)
+        quet_in_queue_jobs = len(self.quet_wait_list)
+        cam_in_queue_jobs = queo_in_queue_jobs + quet_in_queue_jobs
+        
+        cam_in_queue_queo_blocks = -(-queo_in_queue_jobs // BATCH_SIZE)
+        cam_in_queue_quet_blocks = -(-quet_in_queue_jobs // BATCH_SIZE)
+        
+        cam_in_service = self.cam.count 
+
+        assemble_o_waiting = self.queo_assembler.batch_count
+        assemble_t_waiting = self.quet_assembler.batch_count
+        
+        total_remaining = (mac_in_queue + mac_in_service + 
+                           cam_in_queue_jobs + cam_in_service + 
+                           assemble_o_waiting + assemble_t_waiting)
+        
+        print(f"1. TOTAL ELEMENTS REMAINING IN SYSTEM (Jobs): {total_remaining}")
+        print("   - MAC Queue (waiting jobs):", mac_in_queue)
+        print("   - MAC Service (in use jobs):", mac_in_service)
+        print(f"   - CAM QUEO Queue (blocks): {cam_in_queue_queo_blocks} ({queo_in_queue_jobs} jobs)")
+        print(f"   - CAM QUET Queue (blocks): {cam_in_queue_quet_blocks} ({quet_in_queue_jobs} jobs)")
+        print("   - CAM Service (in use jobs):", cam_in_service)
+        print(f"   - Elements in QUEO: {self.queo_counter.count}")
+        
+        print(f"   - Elements in QUET: {self.quet_counter.count}")
+        print("-" * 50)
+        
+        print(f"2. Jobs Generated: {self.jobs_generated}")
+        print(f"3. Jobs Terminated: {self.jobs_terminated}")
+        
+        
+        print("\n--- Time-Weighted Averages and Wait Times ---")
+        
+        now = self.env.now
+        self.record_queue_length(now, self.queue_queo_length, self.queo_wait_list, is_cam_queue=True)
+        self.record_queue_length(now, self.queue_quet_length, self.quet_wait_list, is_cam_queue=True)
+        
+        avg_mac_queue = self.calculate_time_weighted_average(self.mac.queue_length)
+        avg_queo_queue = self.calculate_time_weighted_average(self.queue_queo_length)
+        avg_quet_queue = self.calculate_time_weighted_average(self.queue_quet_length)
+        
+        if self.queo_wait_times:
+            print(f"4.1 Average time in QUEO: {math.fsum(self.queo_wait_times) / len(self.queo_wait_times):.3f}")
+        if self.quet_wait_times:
+            print(f"4.2 Average time in QUET: {math.fsum(self.quet_wait_times) / len(self.quet_wait_times):.3f}")
+        print(f"5. Average MAC Queue Size (Jobs): {avg_mac_queue:.3f}")
+        print(f"6. Average CAM QUEO Queue Size (Blocks): {avg_queo_queue:.3f}")
+        print(f"7. Average CAM QUET Queue Size (Blocks): {avg_quet_queue:.3f}")
+
+        if self.mac_wait_times:
+            print(f"8. Average MAC Wait Time: {math.fsum(self.mac_wait_times) / len(self.mac_wait_times):.3f}")
+        if self.system_times:
+            print(f"9. Average Total Time in System: {math.fsum(self.system_times) / len(self.system_times):.3f}")
+            
+        print("\n--- Custom Logic Statistics ---")
+        print(f"10. Total Instances assigned Priority 1: {self.priority_1_count}")
+
+        if utilization:
+            print("\n--- Utilization Statistics ---")
+            
+            avg_mac_in_use = self.calculate_time_weighted_average(self.mac.usage)
+            avg_cam_in_use = self.calculate_time_weighted_average(self.cam.usage)
+            
+            mac_utilization = (avg_mac_in_use / MAC_CAPACITY) * 100
+            cam_utilization = (avg_cam_in_use / CAM_CAPACITY) * 100
+            
+            print(f"11. Average MAC Utilization: {mac_utilization:.2f}% (Average {avg_mac_in_use:.3f} out of {MAC_CAPACITY} units in use)")
+            print(f"12. Average CAM Utilization: {cam_utilization:.2f}% (Average {avg_cam_in_use:.3f} out of {CAM_CAPACITY} units in use)")
+        print("="*50)
+
+
+# --- The AGPSS Transaction/Job Logic ---
+
+def job_process(env, mac, cam, stats, job_id, priority, counter, cam_section):
+
+    # env.now only moves across a yield, so the arrival time doubles as the
+    # start of the MAC wait
+    arrival_time = env.now
+
+    # 1. MAC Facility Section
+    req = mac.request(priority=priority)
+    yield req
+    try:
+        stats.mac_wait_times.append(env.now - arrival_time)
+        
+        yield env.timeout(pool.next_expon())
+        
+        if job_id in stats.error_jobs:
+            yield env.timeout(next(stats.error_delays))
+    finally:
+        mac.release(req)
+
+    # ASSEMBLE 200, counted as the job leaves the MAC: only every
+    # BATCH_SIZE-th job of the branch proceeds to the CAM, the other 199 are
+    # 'lost' (they exit without terminating), so their CAM section is
+    # never even created
+    counter.count += 1
+    if counter.count < BATCH_SIZE:
+        return
+    counter.count = 0
+            
+    # 2. CAM Facility Section (branch picked by job_generator)
+    yield from cam_section(env, cam, stats, job_id, arrival_time)
+
+
+def cam_branch(env, cam, stats, job_id, arrival_time, wait_list, wait_times, queue_length):
+    now = cam_wait_start = env.now
+    req_cam = cam.request(priority=0)
+
+    # ARRIVE queo/quet. A request that is granted on the spot never waits,
+    # so it would only add and remove a zero-length step: the queue is
+    # sampled only for jobs that actually have to wait for a CAM unit
+    waits = not req_cam.triggered
+    if waits:
+        wait_list.add(job_id)
+        stats.record_queue_length(now, queue_length, wait_list, is_cam_queue=True)
+
+    yield req_cam
+    try:
+        now = env.now
+        cam_wait = now - cam_wait_start
+        wait_times.append(cam_wait)
+        stats.cam_wait_times.append(cam_wait)
+
+        # Job is processed, remove from manual list
+        if waits:
+            wait_list.remove(job_id)
+            stats.record_queue_length(now, queue_length, wait_list, is_cam_queue=True)
+
+        yield env.timeout(pool.next_cam())
+    finally:
+        cam.release(req_cam)
+
+    # TERMINATE
+    stats.jobs_terminated += 1
+    stats.system_times.append(env.now - arrival_time)
+
+
+def cam_quet(env, cam, stats, job_id, arrival_time):
+    # --- ZNT Branch (quet) ---
+    return cam_branch(env, cam, stats, job_id, arrival_time, stats.quet_wait_list,
+                      stats.quet_wait_times, stats.queue_quet_length)
+
+
+def cam_queo(env, cam, stats, job_id, arrival_time):
+    # --- Default Branch (queo) ---
+    return cam_branch(env, cam, stats, job_id, arrival_time, stats.queo_wait_list,
+                      stats.queo_wait_times, stats.queue_queo_length)
+
+# --- The GENERATE/Source Functions (CORRECTED Priority Logic) ---
+
+def job_generator(env, mac, cam, stats, jobs):
+    """Generates jobs."""
+    job_id = 0
+    
+    # Every arrival time and per-job decision was drawn up front (draw_jobs)
+    arrival_times = jobs.arrival_times[1:]
+    priorities = jobs.priorities[1:]
+    branches = jobs.branches[1:]
+    
+    # Bound once, outside the per-arrival loop; indexed by the branch draw:
+    # False -> queo, True -> quet (ZNT)
+    timeout = env.timeout
+    process = env.process
+    branch_table = ((stats.queo_counter, cam_queo),
+                    (stats.quet_counter, cam_quet))
+    
+    for arrival_time, priority, branch in zip(arrival_times, priorities, branches):
+        job_id += 1
+        stats.jobs_generated += 1
+        
+        yield timeout(arrival_time - env.now)
+        
+        stats.priority_1_count += priority
+        
+        counter, cam_section = branch_table[branch]
+        process(job_process(env, mac, cam, stats, job_id, priority, counter, cam_section))
+
+
+def run_simulation(until_time, utilization=False, graph=False, output_dir=None):
+    """Sets up the environment and runs the simulation."""
+    
+    print("--- Starting SimPy AGPSS Conversion with Corrected Priority ---")
+
+    env = simpy.Environment()
+    
+    # The graphs include the utilization plots, so they need the usage series too
+    if utilization or graph:
+        mac = UtilizationResource(env, capacity=MAC_CAPACITY)
+        cam = UtilizationResource(env, capacity=CAM_CAPACITY)
+    else:
+        mac = MonitoredResource(env, MAC_CAPACITY, StepSeries)
+        cam = TwoPriorityResource(env, capacity=CAM_CAPACITY)
+    
+    jobs = new_jobs()
+    stats = StatisticsCollector(env, jobs)
+    
+    queo_assembler = BatchAssembler(env, 'queo', BATCH_SIZE, stats)
+    quet_assembler = BatchAssembler(env, 'quet', BATCH_SIZE, stats)
+    
+    stats.mac = mac
+    stats.cam = cam
+    stats.queo_assembler = queo_assembler
+    stats.quet_assembler = quet_assembler
+    
+    env.process(job_generator(env, mac, cam, stats, jobs))
+    
+    env.run(until=until_time)
+    
+    print(f"--- Simulation Run Complete at Time {env.now:.2f} ---")
+    
+    stats.report(utilization=utilization)
+
+    if graph:
+        stats.generate_graphs(output_dir)
+
+# --- Specialized heapq Event Loop (no SimPy) ---
+
+ARRIVAL, MAC_DONE, ERROR_DONE, CAM_DONE = range(4)
+
+class HeapFacility:
+    # A facility of run_heap: units in use, waiting jobs (one FIFO per
+    # priority, the lower value served first) and the same series as
+    # MonitoredResource/UtilizationResource, under the names the report
+    # and the graphs read from a SimPy resource
+    def __init__(self, track_usage=False):
+        self.count = 0
+        self.waiting = (deque(), deque())
+        self.queue_length = StepSeries()
+        self.usage = StepSeries() if track_usage else None
+
+    @property
+    def queue(self):
+        return [*self.waiting[0], *self.waiting[1]]
+
+    def record_usage(self, now):
+        if self.usage is not None:
+            self.usage.record(now, self.count)
+
+def run_heap(until_time, utilization=False, graph=False, output_dir=None):
+    """Runs the same model on a bespoke heapq event loop instead of SimPy.
+    
+    Events are plain (time, seq, kind, job_id) tuples on one heap and the
+    facilities are HeapFacility counters, so no process, Event or Request
+    is created per job. The draws are made in the same order and from the
+    same RNGPool streams as run_simulation, so the report is the same.
+    """
+    
+    print("--- Starting heapq AGPSS Conversion with Corrected Priority ---")
+    
+    # The report reads the final time from stats.env.now, like a SimPy run
+    clock = SimpleNamespace(now=0.0)
+    jobs = new_jobs()
+    stats = StatisticsCollector(clock, jobs)
+    
+    mac = HeapFacility(utilization or graph)
+    cam = HeapFacility(utilization or graph)
+    stats.mac = mac
+    stats.cam = cam
+    # BatchAssembler is not used by the lossy logic, its count stays at 0
+    stats.queo_assembler = stats.quet_assembler = SimpleNamespace(batch_count=0)
+    
+    next_expon = pool.next_expon
+    next_cam = pool.next_cam
+    error_jobs = stats.error_jobs
+    error_delays = stats.error_delays
+    max_jobs = MAX_JOBS
+    
+    # The same up-front draws as run_simulation, indexed by job id
+    arrival_times = jobs.arrival_times
+    priorities = jobs.priorities
+    branches = jobs.branches
+    
+    # Per branch (queo = 0, quet = 1), as picked by cam_queo/cam_quet
+    counters = (stats.queo_counter, stats.quet_counter)
+    wait_lists = (stats.queo_wait_list, stats.quet_wait_list)
+    wait_times = (stats.queo_wait_times, stats.quet_wait_times)
+    queue_lengths = (stats.queue_queo_length, stats.queue_quet_length)
+    
+    seq = count() # FIFO among simultaneous events, like SimPy's event ids
+    events = [(arrival_times[1], next(seq), ARRIVAL, 1)]
+    mac_waiting = mac.waiting
+    cam_waiting = cam.waiting[0] # (job_id, request time); the CAM is always priority 0
+    
+    def start_mac(job_id, now):
+        mac.count += 1
+        mac.record_usage(now)
+        stats.mac_wait_times.append(now - arrival_times[job_id])
+        heappush(events, (now + next_expon(), next(seq), MAC_DONE, job_id))
+    
+    def start_cam(job_id, now, cam_wait_start):
+        cam.count += 1
+        cam.record_usage(now)
+        cam_wait = now - cam_wait_start
+        wait_times[branches[job_id]].append(cam_wait)
+        stats.cam_wait_times.append(cam_wait)
+        heappush(events, (now + next_cam(), next(seq), CAM_DONE, job_id))
+    
+    def leave_mac(job_id, now):
+        mac.count -= 1
+        mac.record_usage(now)
+        
+        # ASSEMBLE 200 on MAC exit: only every BATCH_SIZE-th job of the
+        # branch requests the CAM, as in job_process
+        branch = branches[job_id]
+        counter = counters[branch]
+        counter.count += 1
+        if counter.count >= BATCH_SIZE:
+            counter.count = 0
+            if cam.count < CAM_CAPACITY:
+                start_cam(job_id, now, now)
+            else:
+                # ARRIVE queo/quet, only for jobs that actually wait
+                cam_waiting.append((job_id, now))
+                wait_lists[branch].add(job_id)
+                stats.record_queue_length(now, queue_lengths[branch], wait_lists[branch], is_cam_queue=True)
+        
+        waiting = mac_waiting[0] or mac_waiting[1]
+        if waiting:
+            next_id = waiting.popleft()
+            mac.queue_length.record(now, len(mac_waiting[0]) + len(mac_waiting[1]))
+            start_mac(next_id, now)
+    
+    arrived = 0
+    
+    while events:
+        now, _, kind, job_id = heappop(events)
+        # Like env.run(until=...), events at until_time are not processed
+        if now >= until_time:
+            break
+        
+        if kind == ARRIVAL:
+            arrived += 1
+            priority = priorities[job_id]
+            stats.priority_1_count += priority
+            if job_id < max_jobs:
+                heappush(events, (arrival_times[job_id + 1], next(seq), ARRIVAL, job_id + 1))
+            
+            if mac.count < MAC_CAPACITY:
+                start_mac(job_id, now)
+            else:
+                mac_waiting[priority].append(job_id)
+                mac.queue_length.record(now, len(mac_waiting[0]) + len(mac_waiting[1]))
+        
+        elif kind == MAC_DONE:
+            if job_id in error_jobs:
+                heappush(events, (now + next(error_delays), next(seq), ERROR_DONE, job_id))
+            else:
+                leave_mac(job_id, now)
+        
+        elif kind == ERROR_DONE:
+            leave_mac(job_id, now)
+        
+        else: # CAM_DONE, TERMINATE
+            cam.count -= 1
+            cam.record_usage(now)
+            stats.jobs_terminated += 1
+            stats.system_times.append(now - arrival_times[job_id])
+            
+            if cam_waiting:
+                next_id, cam_wait_start = cam_waiting.popleft()
+                start_cam(next_id, now, cam_wait_start)
+                branch = branches[next_id]
+                wait_lists[branch].remove(next_id)
+                stats.record_queue_length(now, queue_lengths[branch], wait_lists[branch], is_cam_queue=True)
+    
+    # job_generator counts a job before waiting for its arrival
+    stats.jobs_generated = min(arrived + 1, max_jobs)
+    clock.now = until_time
+    
+    print(f"--- Simulation Run Complete at Time {clock.now:.2f} ---")
+    
+    stats.report(utilization=utilization)
+
+    if graph:
+        stats.generate_graphs(output_dir)
+
+# --- Execution ---
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="SimPy conversion of the PROGFINAL_1 GPSS model")
+    parser.add_argument('--utilization', action='store_true',
+                        help="track the units in use of MAC and CAM and report their utilization")
+    parser.add_argument('--graph', action='store_true',
+                        help="plot utilization and queue lengths over time after the report")
+    parser.add_argument('--output-dir', metavar='DIR',
+                        help="with --graph, save the plots as PNG files in DIR instead of showing them")
+    parser.add_argument('--engine', choices=['simpy', 'heap'], default='simpy',
+                        help="SimPy model (default) or the specialized heapq event loop")
+    args = parser.parse_args()
+    if args.output_dir is not None and not args.graph:
+        parser.error("--output-dir requires --graph")
+
+    run = run_heap if args.engine == 'heap' else run_simulation
+    run(SIMULATION_TIME, utilization=args.utilization, graph=args.graph,
+        output_dir=args.output_dir)